@@ -1,4 +1,5 @@
-from typing import List, Optional
+from typing import Any, List, Optional, Tuple, Union
+import logging
 import time
 import sys
 from pathlib import Path
@@ -13,9 +14,14 @@ from cdcl_core import CDCLCore
 from heuristics import HeuristicStrategy, VSIDSStrategy, JWStrategy, DLISStrategy, RandomStrategy
 from logging_utils import CSVLogger
 
+log = logging.getLogger('cdcl')
+
 
 class CDCLSolverBaseline(CDCLCore):
-    def __init__(self, num_vars: int, clauses: List[List[int]], heuristic: str = "vsids"):
+    # length of the feature_context vector
+    CONTEXT_DIM = 11
+
+    def __init__(self, num_vars: int, clauses: Union[List[List[int]], Tuple[Any, Any]], heuristic: str = "vsids"):
         super().__init__(num_vars, clauses)
         self.heuristic_name = heuristic.lower()
         if self.heuristic_name == "vsids":
@@ -39,23 +45,16 @@ class CDCLSolverBaseline(CDCLCore):
 
     def feature_context(self, since_conflicts: int, since_decisions: int, since_props: int, since_time: float) -> List[float]:
         # reuse logic similar to RL solver for logging comparability
-        if self.recent_lbd:
-            avg_lbd = sum(self.recent_lbd) / len(self.recent_lbd)
-            var_lbd = sum((x - avg_lbd) ** 2 for x in self.recent_lbd) / len(self.recent_lbd)
-            glue_ratio = sum(1 for x in self.recent_lbd if x <= 2) / len(self.recent_lbd)
-        else:
-            avg_lbd = 0.0
-            var_lbd = 0.0
-            glue_ratio = 0.0
+        avg_lbd = self.recent_lbd.mean()
+        var_lbd = self.recent_lbd.variance()
+        glue_ratio = self.recent_lbd.glue_ratio()
         # since_time not tracked here; set conf_rate proxy to 0
         conf_rate = 0.0
-        max_act = max(self.activity[1:], default=1.0)
-        mean_act = sum(self.activity[1:]) / max(1, self.num_vars)
-        std_act = (sum((a - mean_act) ** 2 for a in self.activity[1:]) / max(1, self.num_vars)) ** 0.5
+        max_act, mean_act, std_act = self.activity_stats()
         mean_act_n = mean_act / max(1e-9, max_act)
         std_act_n = std_act / max(1e-9, max_act)
-        total_clauses = len(self.clauses)
-        learned = max(0, total_clauses - self.orig_clause_count)
+        learned = self.learnt_count
+        total_clauses = self.orig_clause_count + learned
         learned_ratio = learned / max(1, total_clauses)
         clause_var_ratio = total_clauses / max(1, self.num_vars)
         restarts_rate = (self.restarts) / max(1, self.conflicts)
@@ -89,9 +88,7 @@ class CDCLSolverBaseline(CDCLCore):
         v = self.pick_first_unassigned()
         if v is None:
             return None
-        if self.phase[v] is not None:
-            return v if self.phase[v] else -v
-        return v
+        return self.phase[v] or v
 
     def solve(self) -> bool:
         self.add_watches()
@@ -104,23 +101,21 @@ class CDCLSolverBaseline(CDCLCore):
             conflict = self.propagate()
             if conflict is not None:
                 self.conflicts += 1
-                now = time.time()
-                if self.conflicts % 50 == 0 or now - last_log > 2:
-                    print(f"[BASE:{self.heuristic_name}] lvl={self.decision_level} conf={self.conflicts} dec={self.decisions} prop={self.propagations} rest={self.restarts}")
-                    last_log = now
+                if self.conflicts % 50 == 0:
+                    log.info("[BASE:%s] lvl=%d conf=%d dec=%d prop=%d rest=%d", self.heuristic_name,
+                             self.decision_level, self.conflicts, self.decisions, self.propagations, self.restarts)
+                    last_log = time.time()
                 if self.decision_level == 0:
-                    print('[BASE] UNSAT at level 0')
+                    log.info('[BASE] UNSAT at level 0')
                     # finalize epoch logging
                     self._log_epoch(final=True)
                     return False
                 learnt, bt = self.analyze_conflict(conflict)
                 self.backtrack(bt)
-                self.clauses.append(learnt)
+                self.add_learnt(learnt)
                 if isinstance(self.heuristic, JWStrategy):
                     self.heuristic.notify_clause_added(self, learnt)
-                self.watch_literal(learnt, learnt[0])
-                if len(learnt) > 1:
-                    self.watch_literal(learnt, learnt[1])
+                # after the backjump the learnt clause is unit; it is its asserting literal's reason
                 self.enqueue(learnt[0], learnt)
                 self.maybe_restart()
                 # baseline epoch step
@@ -129,15 +124,18 @@ class CDCLSolverBaseline(CDCLCore):
             else:
                 lit = self.pick_branch_literal()
                 if lit is None:
-                    print(f"[BASE:{self.heuristic_name}] SAT after {self.conflicts} conflicts")
+                    log.info("[BASE:%s] SAT after %d conflicts", self.heuristic_name, self.conflicts)
                     self._log_epoch(final=True)
                     return True
                 self.decision_level += 1
                 self.trail_limits.append(len(self.trail))
                 self.enqueue(lit, None)
-                if time.time() - last_log > 2:
-                    print(f"[BASE:{self.heuristic_name}] new lvl={self.decision_level}")
-                    last_log = time.time()
+                # the 2s heartbeat only needs the clock every few decisions, not on each one
+                if self.decisions % 50 == 0:
+                    now = time.time()
+                    if now - last_log > 2:
+                        log.info("[BASE:%s] new lvl=%d", self.heuristic_name, self.decision_level)
+                        last_log = now
 
     def _log_epoch(self, final: bool = False):
         if self.logger is None:
@@ -157,7 +155,7 @@ class CDCLSolverBaseline(CDCLCore):
             'd_conflicts': d_conf,
             'd_decisions': d_dec,
             'd_propagations': d_prop,
-            'avg_lbd': (sum(self.recent_lbd) / len(self.recent_lbd)) if self.recent_lbd else 0.0,
+            'avg_lbd': self.recent_lbd.mean(),
             'conflicts': self.conflicts,
             'decisions': self.decisions,
             'propagations': self.propagations,
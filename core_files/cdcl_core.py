@@ -1,63 +1,379 @@
-from typing import List, Optional
+from collections import deque
+from typing import Any, List, Optional, Tuple, Union
+import heapq
 import math
+import operator
+
+
+class LBDWindow:
+    """Sliding window of recent LBD values with running sums, so its stats are O(1)."""
+
+    def __init__(self, capacity: int, glue_lbd: int = 2):
+        self.capacity = capacity
+        self.glue_lbd = glue_lbd
+        self.buf: deque = deque()
+        self.s = 0
+        self.s2 = 0
+        self.glue = 0
+
+    def push(self, x: int):
+        buf = self.buf
+        if len(buf) == self.capacity:
+            old = buf.popleft()
+            self.s -= old
+            self.s2 -= old * old
+            self.glue -= old <= self.glue_lbd
+        buf.append(x)
+        self.s += x
+        self.s2 += x * x
+        self.glue += x <= self.glue_lbd
+
+    def __len__(self) -> int:
+        return len(self.buf)
+
+    def __iter__(self):
+        return iter(self.buf)
+
+    def mean(self) -> float:
+        n = len(self.buf)
+        return self.s / n if n else 0.0
+
+    def variance(self) -> float:
+        n = len(self.buf)
+        # LBDs are ints, so the numerator is exact
+        return (n * self.s2 - self.s * self.s) / (n * n) if n else 0.0
+
+    def glue_ratio(self) -> float:
+        n = len(self.buf)
+        return self.glue / n if n else 0.0
+
+
+class VarOrderHeap:
+    """Binary max-heap of variables keyed on activity; ties go to the lower variable index."""
+
+    def __init__(self, activity: List[float], variables):
+        self.activity = activity
+        self.heap: List[int] = list(variables)
+        # position of each variable in heap, -1 when absent
+        self.indices = [-1] * len(activity)
+        self.rebuild()
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def __contains__(self, v: int) -> bool:
+        return self.indices[v] >= 0
+
+    def rebuild(self):
+        # a list sorted by (-activity, var) is already a valid heap
+        act = self.activity
+        self.heap.sort(key=lambda v: (-act[v], v))
+        indices = self.indices
+        for pos, v in enumerate(self.heap):
+            indices[v] = pos
+
+    def _sift_up(self, pos: int):
+        heap, indices, act = self.heap, self.indices, self.activity
+        v = heap[pos]
+        a = act[v]
+        while pos > 0:
+            parent = (pos - 1) >> 1
+            p = heap[parent]
+            if act[p] > a or (act[p] == a and p < v):
+                break
+            heap[pos] = p
+            indices[p] = pos
+            pos = parent
+        heap[pos] = v
+        indices[v] = pos
+
+    def _sift_down(self, pos: int):
+        heap, indices, act = self.heap, self.indices, self.activity
+        n = len(heap)
+        v = heap[pos]
+        a = act[v]
+        while True:
+            child = 2 * pos + 1
+            if child >= n:
+                break
+            c = heap[child]
+            right = child + 1
+            if right < n:
+                r = heap[right]
+                if act[r] > act[c] or (act[r] == act[c] and r < c):
+                    child, c = right, r
+            if a > act[c] or (a == act[c] and v < c):
+                break
+            heap[pos] = c
+            indices[c] = pos
+            pos = child
+        heap[pos] = v
+        indices[v] = pos
+
+    def push(self, v: int):
+        if self.indices[v] >= 0:
+            return
+        self.heap.append(v)
+        self._sift_up(len(self.heap) - 1)
+
+    def increased(self, v: int):
+        pos = self.indices[v]
+        if pos >= 0:
+            self._sift_up(pos)
+
+    def pop(self) -> int:
+        heap = self.heap
+        top = heap[0]
+        last = heap.pop()
+        self.indices[top] = -1
+        if heap:
+            heap[0] = last
+            self._sift_down(0)
+        return top
+
+
+class OccurrenceCounter:
+    """Per-literal count of currently unsatisfied clauses containing that literal (DLIS scores)."""
+
+    def __init__(self, num_vars: int, clauses: List[List[int]], assignments: List[Optional[bool]]):
+        self.num_vars = num_vars
+        size = 2 * num_vars + 1
+        # literal index (lit + num_vars) -> ids of the clauses containing it
+        self.occurs: List[List[int]] = [[] for _ in range(size)]
+        # per clause: its distinct literal indices and how many of them are currently true
+        self.clause_lits: List[List[int]] = []
+        self.true_count: List[int] = []
+        self.count = [0] * size
+        # number of clauses with at least one true literal
+        self.num_sat = 0
+        for clause in clauses:
+            self.add_clause(clause, assignments)
+
+    def add_clause(self, clause: List[int], assignments: List[Optional[bool]]):
+        nv = self.num_vars
+        cid = len(self.true_count)
+        idxs = list(dict.fromkeys(lit + nv for lit in clause))
+        n_true = 0
+        for i in idxs:
+            self.occurs[i].append(cid)
+            lit = i - nv
+            if assignments[abs(lit)] is (lit > 0):
+                n_true += 1
+        self.clause_lits.append(idxs)
+        self.true_count.append(n_true)
+        if n_true:
+            self.num_sat += 1
+        else:
+            count = self.count
+            for i in idxs:
+                count[i] += 1
+
+    def assigned(self, lit: int):
+        # lit just became true: clauses it satisfies for the first time stop counting
+        true_count, clause_lits, count = self.true_count, self.clause_lits, self.count
+        newly_sat = 0
+        for cid in self.occurs[lit + self.num_vars]:
+            true_count[cid] += 1
+            if true_count[cid] == 1:
+                newly_sat += 1
+                for i in clause_lits[cid]:
+                    count[i] -= 1
+        self.num_sat += newly_sat
+
+    def unassigned(self, lit: int):
+        true_count, clause_lits, count = self.true_count, self.clause_lits, self.count
+        newly_unsat = 0
+        for cid in self.occurs[lit + self.num_vars]:
+            true_count[cid] -= 1
+            if not true_count[cid]:
+                newly_unsat += 1
+                for i in clause_lits[cid]:
+                    count[i] += 1
+        self.num_sat -= newly_unsat
+
+
+def clauses_from_csr(lits: Any, offsets: Any) -> List[List[int]]:
+    """Clause lists from a CSR pair: clause i is lits[offsets[i]:offsets[i + 1]]."""
+    # numpy arrays: slice plain lists of Python ints rather than one ndarray per clause
+    if hasattr(lits, 'tolist'):
+        lits = lits.tolist()
+    if hasattr(offsets, 'tolist'):
+        offsets = offsets.tolist()
+    return [lits[start:stop] for start, stop in zip(offsets, offsets[1:])]
 
 
 class CDCLCore:
-    def __init__(self, num_vars: int, clauses: List[List[int]]):
+    def __init__(self, num_vars: int, clauses: Union[List[List[int]], Tuple[Any, Any]]):
         self.num_vars = num_vars
+        if isinstance(clauses, tuple):
+            # (lits, offsets) as returned by parse_dimacs_csr; propagation works on lists
+            clauses = clauses_from_csr(*clauses)
         self.clauses = clauses
+        # None while unassigned, otherwise the bool singleton True/False; a literal is true
+        # exactly when assignments[abs(lit)] is (lit > 0), with no separate None test
         self.assignments = [None] * (num_vars + 1)
         self.level = [0] * (num_vars + 1)
         self.reason = [None] * (num_vars + 1)
         self.trail: List[int] = []
         self.trail_limits: List[int] = []
+        # index of the next trail literal whose watches have not been visited yet
+        self.qhead = 0
         self.decision_level = 0
         self.watched_literals = [[] for _ in range(2 * num_vars + 1)]
+        # binary clauses bypass the watches: literal index -> (other literal, clause) pairs
+        # to imply once that literal is false
+        self.bin_imp: List[List[Tuple[int, List[int]]]] = [[] for _ in range(2 * num_vars + 1)]
         # stats and helper structures
         self.activity = [0.0] * (num_vars + 1)
         self.act_inc = 1.0
         self.act_decay = 0.95
-        self.phase = [None] * (num_vars + 1)
+        # running sum, sum of squares and max of activity, kept by the bump methods so
+        # activity_stats is O(1); recomputed exactly whenever activities are rescaled
+        self.act_sum = 0.0
+        self.act_sumsq = 0.0
+        self.act_max = 0.0
+        # activity-ordered heap of decision candidates, built on first use (see enable_order_heap)
+        self.order_heap: Optional[VarOrderHeap] = None
+        # unsatisfied-clause counts per literal, built on first use (see enable_occ_counts)
+        self.occ_counts: Optional[OccurrenceCounter] = None
+        # min-heap of unassigned variables for pick_first_unassigned, built on first use;
+        # assigned entries are dropped lazily, in_free_heap avoids duplicate pushes
+        self.free_heap: Optional[List[int]] = None
+        self.in_free_heap: List[bool] = []
+        # saved phase: the literal last assigned to each variable, 0 if it never was
+        self.phase = [0] * (num_vars + 1)
         self.conflicts = 0
         self.decisions = 0
         self.propagations = 0
         self.restarts = 0
         self.orig_clause_count = len(clauses)
-        self.recent_lbd: List[int] = []
+        self.learnt_count = 0
+        # analyze_conflict marks a var as seen by writing the current stamp, so nothing needs clearing
+        self.seen_stamp = [0] * (num_vars + 1)
+        self.analyze_stamp = 0
         self.lbd_window = 100
+        # learnt clauses with LBD <= glue_lbd are "glue"; their variables get an extra
+        # glue_bump_mult * act_inc bump on top of the regular one (0 disables it)
+        self.glue_lbd = 2
+        self.glue_bump_mult = 1.0
+        self.recent_lbd = LBDWindow(self.lbd_window, self.glue_lbd)
 
     def literal_to_index(self, lit: int) -> int:
         return lit + self.num_vars
 
     def watch_literal(self, clause: List[int], lit: int):
-        self.watched_literals[self.literal_to_index(lit)].append(clause)
+        # each watch carries a blocker: another literal of the clause that, when true,
+        # lets propagate skip the clause without walking it
+        blocker = clause[0] if clause[0] != lit else clause[-1]
+        self.watched_literals[self.literal_to_index(lit)].append((clause, blocker))
+
+    def add_binary(self, clause: List[int]):
+        a, b = clause
+        self.bin_imp[self.literal_to_index(a)].append((b, clause))
+        self.bin_imp[self.literal_to_index(b)].append((a, clause))
 
     def add_watches(self):
         for clause in self.clauses:
-            if len(clause) > 0:
+            if len(clause) == 2:
+                self.add_binary(clause)
+            elif len(clause) > 0:
                 self.watch_literal(clause, clause[0])
                 if len(clause) > 1:
                     self.watch_literal(clause, clause[1])
 
+    def enable_occ_counts(self) -> OccurrenceCounter:
+        if self.occ_counts is None:
+            self.occ_counts = OccurrenceCounter(self.num_vars, self.clauses, self.assignments)
+        return self.occ_counts
+
+    def add_learnt(self, clause: List[int]):
+        self.clauses.append(clause)
+        self.learnt_count += 1
+        if self.occ_counts is not None:
+            self.occ_counts.add_clause(clause, self.assignments)
+        if len(clause) == 2:
+            self.add_binary(clause)
+            return
+        self.watch_literal(clause, clause[0])
+        if len(clause) > 1:
+            self.watch_literal(clause, clause[1])
+
+    def enable_order_heap(self) -> VarOrderHeap:
+        if self.order_heap is None:
+            # every unassigned variable must be in the heap; assigned ones are skipped when popped
+            self.order_heap = VarOrderHeap(self.activity, range(1, self.num_vars + 1))
+        return self.order_heap
+
     def bump_activity(self, clause: List[int]):
+        heap = self.order_heap
+        act = self.activity
+        inc = self.act_inc
+        sumsq, mx = self.act_sumsq, self.act_max
         for lit in clause:
             v = abs(lit)
-            self.activity[v] += self.act_inc
+            old = act[v]
+            new = old + inc
+            act[v] = new
+            sumsq += new * new - old * old
+            if new > mx:
+                mx = new
+            if heap is not None:
+                heap.increased(v)
+        self.act_sum += inc * len(clause)
+        self.act_sumsq, self.act_max = sumsq, mx
         self.act_inc /= self.act_decay
-        if max(self.activity[1:], default=0.0) > 1e100:
+        # bumps only ever raise activities, so the running max is exact and the overflow
+        # test needs no scan
+        if mx > 1e100:
             for i in range(1, self.num_vars + 1):
-                self.activity[i] *= 1e-100
+                act[i] *= 1e-100
+            # scale the increment with them, or the next bump is back above the threshold
+            self.act_inc *= 1e-100
+            self.recompute_activity_stats()
+            if heap is not None:
+                # rescaling can flush small activities to equal values; reorder in bulk
+                heap.rebuild()
+
+    def recompute_activity_stats(self):
+        act = self.activity
+        self.act_sum = math.fsum(act)
+        self.act_sumsq = math.fsum(map(operator.mul, act, act))
+        self.act_max = max(act)
+
+    def bump_glue(self, clause: List[int]):
+        # extra bump for each distinct variable; act_inc is left to decay in bump_activity,
+        # which runs right after and also handles rescaling
+        heap = self.order_heap
+        act = self.activity
+        inc = self.act_inc * self.glue_bump_mult
+        sumsq, mx = self.act_sumsq, self.act_max
+        glue_vars = {abs(lit) for lit in clause}
+        for v in glue_vars:
+            old = act[v]
+            new = old + inc
+            act[v] = new
+            sumsq += new * new - old * old
+            if new > mx:
+                mx = new
+            if heap is not None:
+                heap.increased(v)
+        self.act_sum += inc * len(glue_vars)
+        self.act_sumsq, self.act_max = sumsq, mx
 
     def enqueue(self, lit: int, reason: Optional[List[int]]):
         var = abs(lit)
         val = lit > 0
-        if self.assignments[var] is not None:
-            return self.assignments[var] == val
-        self.assignments[var] = val
+        assignments = self.assignments
+        cur = assignments[var]
+        if cur is not None:
+            return cur == val
+        assignments[var] = val
         self.reason[var] = reason
         self.level[var] = self.decision_level
         self.trail.append(lit)
-        self.phase[var] = val
+        self.phase[var] = lit
+        if self.occ_counts is not None:
+            self.occ_counts.assigned(lit)
         if reason is None:
             self.decisions += 1
         else:
@@ -65,120 +381,230 @@ class CDCLCore:
         return True
 
     def is_satisfied(self, clause: List[int]) -> bool:
+        assignments = self.assignments
         for lit in clause:
-            val = self.assignments[abs(lit)]
-            if val is not None and ((lit > 0 and val) or (lit < 0 and not val)):
+            if assignments[abs(lit)] is (lit > 0):
                 return True
         return False
 
     def propagate(self) -> Optional[List[int]]:
-        queue_idx = 0
-        while queue_idx < len(self.trail):
-            lit = self.trail[queue_idx]
-            neg_lit = -lit
-            watch_list = self.watched_literals[self.literal_to_index(neg_lit)]
+        assignments = self.assignments
+        watched = self.watched_literals
+        bin_imp = self.bin_imp
+        trail = self.trail
+        nv = self.num_vars
+        while self.qhead < len(trail):
+            neg_lit = -trail[self.qhead]
+            # binary clauses first: the other literal is implied outright, or the clause conflicts
+            for other, clause in bin_imp[neg_lit + nv]:
+                cur = assignments[abs(other)]
+                if cur is None:
+                    self.enqueue(other, clause)
+                elif cur is not (other > 0):
+                    return clause
+            watch_list = watched[neg_lit + nv]
             i = 0
             while i < len(watch_list):
-                clause = watch_list[i]
-                if self.is_satisfied(clause):
+                clause, blocker = watch_list[i]
+                if assignments[abs(blocker)] is (blocker > 0):
                     i += 1
                     continue
-                found_replacement = False
-                other_lit = None
-                if len(clause) > 1:
-                    for l in clause:
-                        if l != neg_lit:
-                            other_lit = l
-                            break
-                for lit2 in clause:
-                    if lit2 == neg_lit:
-                        continue
-                    val = self.assignments[abs(lit2)]
-                    if val is None or (lit2 > 0 and val) or (lit2 < 0 and not val):
+                # the watched literals are clause[0] and clause[1]; move the false one to slot 1
+                first = clause[0]
+                if first == neg_lit:
+                    if len(clause) == 1:
+                        # a unit clause whose only literal is false
+                        return clause
+                    first = clause[1]
+                    clause[0] = first
+                    clause[1] = neg_lit
+                if first != blocker and assignments[abs(first)] is (first > 0):
+                    watch_list[i] = (clause, first)
+                    i += 1
+                    continue
+                # look past both watches for a literal that is not false to take over this one
+                for k in range(2, len(clause)):
+                    l = clause[k]
+                    if assignments[abs(l)] is not (l < 0):
+                        clause[1] = l
+                        clause[k] = neg_lit
                         watch_list[i] = watch_list[-1]
                         watch_list.pop()
-                        self.watch_literal(clause, lit2)
-                        found_replacement = True
+                        watched[l + nv].append((clause, first))
                         break
-                if not found_replacement:
-                    if other_lit is not None and self.assignments[abs(other_lit)] is None:
-                        if not self.enqueue(other_lit, clause):
-                            return clause
+                else:
+                    # every literal but clause[0] is false: it is implied, or the clause conflicts
+                    if assignments[abs(first)] is None:
+                        self.enqueue(first, clause)
                         i += 1
                         continue
                     return clause
-                else:
-                    i += 1
-            queue_idx += 1
+                # the last watch was swapped into slot i; visit it next
+            self.qhead += 1
         return None
 
     def backtrack(self, level: int):
-        while self.trail and self.level[abs(self.trail[-1])] > level:
-            var = abs(self.trail.pop())
-            self.assignments[var] = None
-            self.reason[var] = None
-            self.level[var] = 0
+        heap = self.order_heap
+        occ = self.occ_counts
+        free = self.free_heap
+        in_free = self.in_free_heap
+        trail = self.trail
+        var_level = self.level
+        assignments = self.assignments
+        reason = self.reason
+        while trail and var_level[abs(trail[-1])] > level:
+            lit = trail.pop()
+            var = abs(lit)
+            if occ is not None:
+                occ.unassigned(lit)
+            assignments[var] = None
+            reason[var] = None
+            var_level[var] = 0
+            if heap is not None:
+                heap.push(var)
+            if free is not None and not in_free[var]:
+                in_free[var] = True
+                heapq.heappush(free, var)
+        self.qhead = min(self.qhead, len(trail))
         self.decision_level = level
 
     def pick_first_unassigned(self) -> Optional[int]:
-        for v in range(1, self.num_vars + 1):
-            if self.assignments[v] is None:
-                return v
-        return None
+        assignments = self.assignments
+        free = self.free_heap
+        if free is None:
+            # an ascending list is already a valid min-heap
+            free = self.free_heap = [v for v in range(1, self.num_vars + 1) if assignments[v] is None]
+            self.in_free_heap = [False] * (self.num_vars + 1)
+            for v in free:
+                self.in_free_heap[v] = True
+        while free and assignments[free[0]] is not None:
+            self.in_free_heap[heapq.heappop(free)] = False
+        return free[0] if free else None
 
     def analyze_conflict(self, conflict_clause: List[int]):
-        learnt_clause: List[int] = []
-        seen = set()
+        # first UIP: resolve the conflict with the reasons of its current-level literals, in
+        # reverse trail order, until one current-level literal is left. learnt_clause[0] is
+        # its negation (the asserting literal); the rest are the lower-level literals met
+        learnt_clause: List[int] = [0]
+        self.analyze_stamp += 1
+        stamp = self.analyze_stamp
+        seen = self.seen_stamp
+        level = self.level
+        reason = self.reason
+        trail = self.trail
         counter = 0
         current_level = self.decision_level
-        backtrack_level = 0
-        idx = len(self.trail) - 1
+        idx = len(trail) - 1
 
-        for lit in conflict_clause:
-            var = abs(lit)
-            if self.level[var] == 0:
-                continue
-            if var not in seen:
-                seen.add(var)
-                if self.level[var] == current_level:
+        clause = conflict_clause
+        while True:
+            for lit in clause:
+                var = abs(lit)
+                # seen also skips the resolved variable's own literal in its reason
+                if seen[var] == stamp:
+                    continue
+                lv = level[var]
+                if lv == 0:
+                    continue
+                seen[var] = stamp
+                if lv == current_level:
                     counter += 1
                 else:
-                    backtrack_level = max(backtrack_level, self.level[var])
-                learnt_clause.append(lit)
-
-        while counter > 1:
-            lit = self.trail[idx]
-            var = abs(lit)
-            if var in seen:
-                if self.reason[var] is not None:
-                    for l in self.reason[var]:
-                        u = abs(l)
-                        if u not in seen and self.level[u] > 0:
-                            if self.level[u] == current_level:
-                                counter += 1
-                            else:
-                                backtrack_level = max(backtrack_level, self.level[u])
-                            learnt_clause.append(l)
-                    counter -= 1
-                seen.remove(var)
+                    learnt_clause.append(lit)
+            # the next marked literal down the trail; the unresolved ones are all at the
+            # current level, which is the top of the trail
+            while seen[abs(trail[idx])] != stamp:
+                idx -= 1
+            uip = trail[idx]
             idx -= 1
+            counter -= 1
+            if counter == 0:
+                break
+            clause = reason[abs(uip)]
+        learnt_clause[0] = -uip
 
+        learnt_clause, backtrack_level = self.minimize_learnt(learnt_clause, current_level)
+        if len(learnt_clause) > 1:
+            # watch the asserting literal and the deepest of the others, which is the last
+            # to be unassigned again, so the two watches stay valid after backjumping
+            j = max(range(1, len(learnt_clause)), key=lambda k: level[abs(learnt_clause[k])])
+            learnt_clause[1], learnt_clause[j] = learnt_clause[j], learnt_clause[1]
         lbd = self.compute_lbd(learnt_clause)
-        self.recent_lbd.append(lbd)
-        if len(self.recent_lbd) > self.lbd_window:
-            self.recent_lbd.pop(0)
+        self.recent_lbd.push(lbd)
+        if lbd <= self.glue_lbd and self.glue_bump_mult:
+            self.bump_glue(learnt_clause)
         self.bump_activity(learnt_clause)
         return learnt_clause, backtrack_level
 
-    def compute_lbd(self, clause: List[int]) -> int:
-        levels = set()
+    def minimize_learnt(self, clause: List[int], current_level: int) -> Tuple[List[int], int]:
+        # drop lower-level literals whose reasons are covered by the rest of the clause
+        # (recursively, through further reasons); clause[0] and current-level literals are kept
+        self.analyze_stamp += 1
+        stamp = self.analyze_stamp
+        seen = self.seen_stamp
+        level = self.level
+        reason = self.reason
         for lit in clause:
-            levels.add(self.level[abs(lit)])
-        return len(levels)
+            seen[abs(lit)] = stamp
+        kept = clause[:1]
+        backtrack_level = 0
+        for lit in clause[1:]:
+            var = abs(lit)
+            lv = level[var]
+            if lv < current_level:
+                if reason[var] is not None and self.lit_redundant(var, stamp):
+                    continue
+                backtrack_level = max(backtrack_level, lv)
+            kept.append(lit)
+        return kept, backtrack_level
+
+    def lit_redundant(self, var: int, stamp: int) -> bool:
+        # seen == stamp: in the clause or already shown redundant; seen == -stamp: known not to be
+        seen = self.seen_stamp
+        level = self.level
+        reason = self.reason
+        stack = [var]
+        visited = []
+        while stack:
+            v = stack.pop()
+            for l in reason[v]:
+                u = abs(l)
+                if u == v or seen[u] == stamp or level[u] == 0:
+                    continue
+                if reason[u] is None or seen[u] == -stamp:
+                    for w in visited:
+                        seen[w] = -stamp
+                    return False
+                seen[u] = stamp
+                visited.append(u)
+                stack.append(u)
+        return True
+
+    def compute_lbd(self, clause: List[int]) -> int:
+        level = self.level
+        return len({level[abs(lit)] for lit in clause})
+
+    def activity_stats(self) -> Tuple[float, float, float]:
+        """Max, mean and standard deviation of variable activities."""
+        # from the running stats kept by bump_activity/bump_glue; slot 0 stays 0.0 and
+        # contributes nothing to them
+        n = max(1, self.num_vars)
+        max_act = self.act_max if self.num_vars else 1.0
+        mean_act = self.act_sum / n
+        var_act = self.act_sumsq / n - mean_act * mean_act
+        return max_act, mean_act, math.sqrt(max(0.0, var_act))
 
     def satisfied_ratio(self) -> float:
+        occ = self.occ_counts
+        if occ is not None:
+            # the DLIS counters already track which clauses have a true literal
+            return occ.num_sat / max(1, len(self.clauses))
+        # is_satisfied inlined: this walks every clause once per epoch
+        assignments = self.assignments
         sat = 0
         for c in self.clauses:
-            if self.is_satisfied(c):
-                sat += 1
+            for lit in c:
+                if assignments[abs(lit)] is (lit > 0):
+                    sat += 1
+                    break
         return sat / max(1, len(self.clauses))
@@ -1,8 +1,16 @@
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
+import os
 
-def generate_sleek_solver_architecture_flowchart():
+OUTPUT_PNG = 'solver_architecture_flowchart_sleek_final.png'
+
+def generate_sleek_solver_architecture_flowchart(force=False):
     """Generates a high-quality, sleek flow chart based on the user's sketch."""
+    # the chart only depends on this file, so skip the render if the PNG is newer
+    if not force and os.path.exists(OUTPUT_PNG) and os.path.getmtime(OUTPUT_PNG) >= os.path.getmtime(__file__):
+        return OUTPUT_PNG
+
+    # imported here so importing this module does not pull in matplotlib
+    import matplotlib.pyplot as plt
+    import matplotlib.patches as patches
     
     # Set up the figure and axis
     fig, ax = plt.subplots(figsize=(14, 12))
@@ -125,8 +133,10 @@ def generate_sleek_solver_architecture_flowchart():
 
     # Final Title
     plt.title('Context-Aware Heuristic Selection in CDCL SAT Solvers Using Online Reinforcement Learning', fontsize=14, weight='bold', pad=10)
-    plt.savefig('solver_architecture_flowchart_sleek_final.png', dpi=300, bbox_inches='tight')
+    plt.savefig(OUTPUT_PNG, dpi=300, bbox_inches='tight')
     plt.close(fig)
+    return OUTPUT_PNG
 
 # Execute the function
-generate_sleek_solver_architecture_flowchart()
\ No newline at end of file
+if __name__ == '__main__':
+    generate_sleek_solver_architecture_flowchart()
\ No newline at end of file
@@ -1,6 +1,9 @@
+from itertools import chain
 from typing import List, Optional
 import random
 
+import numpy as np
+
 
 class HeuristicStrategy:
     name: str = "base"
@@ -13,31 +16,30 @@ class RandomStrategy(HeuristicStrategy):
     name = "random"
 
     def decide(self, solver) -> Optional[int]:
-        for v in range(1, solver.num_vars + 1):
-            if solver.assignments[v] is None:
-                if solver.phase[v] is not None:
-                    return v if solver.phase[v] else -v
-                return v if random.random() < 0.5 else -v
-        return None
+        v = solver.pick_first_unassigned()
+        if v is None:
+            return None
+        saved = solver.phase[v]
+        if saved:
+            return saved
+        return v if random.random() < 0.5 else -v
 
 
 class VSIDSStrategy(HeuristicStrategy):
     name = "vsids"
 
     def decide(self, solver) -> Optional[int]:
+        heap = solver.enable_order_heap()
+        assignments = solver.assignments
         best_v = None
-        best_act = -1.0
-        for v in range(1, solver.num_vars + 1):
-            if solver.assignments[v] is None:
-                act = solver.activity[v]
-                if act > best_act:
-                    best_act = act
-                    best_v = v
+        while heap:
+            v = heap.pop()
+            if assignments[v] is None:
+                best_v = v
+                break
         if best_v is None:
             return None
-        if solver.phase[best_v] is not None:
-            return best_v if solver.phase[best_v] else -best_v
-        return best_v
+        return solver.phase[best_v] or best_v
 
 
 class JWStrategy(HeuristicStrategy):
@@ -49,21 +51,19 @@ class JWStrategy(HeuristicStrategy):
 
     def ensure(self, solver):
         if self.pos_w is None or len(self.pos_w) != solver.num_vars + 1:
-            self.pos_w = [0.0] * (solver.num_vars + 1)
-            self.neg_w = [0.0] * (solver.num_vars + 1)
             self.recompute_weights(solver)
 
     def recompute_weights(self, solver):
-        self.pos_w = [0.0] * (solver.num_vars + 1)
-        self.neg_w = [0.0] * (solver.num_vars + 1)
-        for c in solver.clauses:
-            k = max(1, len(c))
-            w = 2.0 ** (-k)
-            for lit in c:
-                if lit > 0:
-                    self.pos_w[abs(lit)] += w
-                else:
-                    self.neg_w[abs(lit)] += w
+        clauses = solver.clauses
+        n = solver.num_vars + 1
+        # flatten once, then scatter-add each literal's 2^-k weight per sign with bincount
+        lens = np.fromiter(map(len, clauses), dtype=np.int64, count=len(clauses))
+        lits = np.fromiter(chain.from_iterable(clauses), dtype=np.int64, count=int(lens.sum()))
+        w = np.repeat(np.ldexp(1.0, -np.maximum(lens, 1)), lens)
+        pos = lits > 0
+        # kept as lists: decide() and notify_clause_added() index them one variable at a time
+        self.pos_w = np.bincount(lits[pos], weights=w[pos], minlength=n).astype(float).tolist()
+        self.neg_w = np.bincount(-lits[~pos], weights=w[~pos], minlength=n).astype(float).tolist()
 
     def notify_clause_added(self, solver, clause: List[int]):
         self.ensure(solver)
@@ -97,37 +97,31 @@ class JWStrategy(HeuristicStrategy):
                 best_sign = sign
         if best_v is None:
             return None
-        if solver.phase[best_v] is not None:
-            return best_v if solver.phase[best_v] else -best_v
-        return best_v if best_sign else -best_v
+        return solver.phase[best_v] or (best_v if best_sign else -best_v)
 
 
 class DLISStrategy(HeuristicStrategy):
     name = "dlis"
 
     def decide(self, solver) -> Optional[int]:
+        # count[lit + num_vars] = number of unsatisfied clauses containing lit, kept current by the core
+        count = solver.enable_occ_counts().count
+        nv = solver.num_vars
+        assignments = solver.assignments
         best_lit = None
         best_count = -1
-        for v in range(1, solver.num_vars + 1):
-            if solver.assignments[v] is not None:
+        for v in range(1, nv + 1):
+            if assignments[v] is not None:
                 continue
-            pos_c = 0
-            neg_c = 0
-            for c in solver.clauses:
-                if solver.is_satisfied(c):
-                    continue
-                if v in map(abs, c):
-                    if v in c:
-                        pos_c += 1
-                    if -v in c:
-                        neg_c += 1
+            pos_c = count[nv + v]
+            neg_c = count[nv - v]
             if pos_c >= neg_c:
-                count = pos_c
+                count_v = pos_c
                 lit = v
             else:
-                count = neg_c
+                count_v = neg_c
                 lit = -v
-            if count > best_count:
-                best_count = count
+            if count_v > best_count:
+                best_count = count_v
                 best_lit = lit
         return best_lit
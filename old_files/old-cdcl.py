@@ -1,36 +1,44 @@
 from typing import List, Optional, Tuple
-from typing import List, Optional, Tuple
+import re
 import time
 
-from run_solver import parse_dimacs
-from cdcl_rl import CDCLSolverRL
+_PROBLEM_RE = re.compile(r'^[ \t]*p[ \t]+cnf[ \t]+(\d+)', re.M)
+_META_RE = re.compile(r'^[ \t]*[cp].*$', re.M)
+_END_RE = re.compile(r'^[ \t]*%', re.M)
 
 
 def cdcl_solver(dimacs_input: str) -> bool:
+    # imported on demand: run_solver pulls in both solvers and the NumPy-backed bandit
+    from run_solver import parse_dimacs
+    from cdcl_rl import CDCLSolverRL
     n, c = parse_dimacs(dimacs_input)
     solver = CDCLSolverRL(n, c)
     return solver.solve()
 
 
 def parse_dimacs_legacy(dimacs: str):
-    lines = dimacs.splitlines()
-    num_vars = 0
+    m = _PROBLEM_RE.search(dimacs)
+    num_vars = int(m.group(1)) if m else 0
+    end = _END_RE.search(dimacs)
+    if end:
+        dimacs = dimacs[:end.start()]
+    # drop comment/problem lines in one C-level pass, tokenize everything at once,
+    # then cut the flat literal list at the 0 terminators
+    lits = list(map(int, _META_RE.sub('', dimacs).split()))
     clauses = []
-    for line in lines:
-        line = line.strip()
-        if not line or line.startswith('c'):
-            continue
-        if line.startswith('p'):
-            parts = line.split()
-            num_vars = int(parts[2])
-        else:
-            lits = list(map(int, line.split()))
-            if lits[-1] == 0:
-                lits.pop()
-            clauses.append(lits)
+    start = 0
+    n = len(lits)
+    while start < n:
+        try:
+            stop = lits.index(0, start)
+        except ValueError:
+            stop = n
+        clauses.append(lits[start:stop])
+        start = stop + 1
     return num_vars, clauses
 
 def cdcl_solver_legacy(dimacs_input: str) -> bool:
+    from cdcl_rl import CDCLSolverRL
     num_vars, clauses = parse_dimacs_legacy(dimacs_input)
     solver = CDCLSolverRL(num_vars, clauses)
     return solver.solve()
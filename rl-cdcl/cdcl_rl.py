@@ -1,6 +1,6 @@
-from typing import List, Optional, Dict
+from typing import Any, List, Optional, Dict, Tuple, Union
+import logging
 import time
-import math
 import sys
 from pathlib import Path
 
@@ -16,9 +16,14 @@ from heuristics import HeuristicStrategy, VSIDSStrategy, JWStrategy, DLISStrateg
 from bandit import LinUCB
 from logging_utils import CSVLogger
 
+log = logging.getLogger('cdcl')
+
 
 class CDCLSolverRL(CDCLCore):
-    def __init__(self, num_vars: int, clauses: List[List[int]]):
+    # length of the feature_context vector
+    CONTEXT_DIM = 11
+
+    def __init__(self, num_vars: int, clauses: Union[List[List[int]], Tuple[Any, Any]]):
         super().__init__(num_vars, clauses)
         self.heuristics: List[HeuristicStrategy] = [VSIDSStrategy(), JWStrategy(), DLISStrategy(), RandomStrategy()]
         self.heuristic_names = [h.name for h in self.heuristics]
@@ -37,22 +42,15 @@ class CDCLSolverRL(CDCLCore):
         self.epoch_index = 0
 
     def feature_context(self, since_conflicts: int, since_decisions: int, since_props: int, since_time: float) -> List[float]:
-        if self.recent_lbd:
-            avg_lbd = sum(self.recent_lbd) / len(self.recent_lbd)
-            var_lbd = sum((x - avg_lbd) ** 2 for x in self.recent_lbd) / len(self.recent_lbd)
-            glue_ratio = sum(1 for x in self.recent_lbd if x <= 2) / len(self.recent_lbd)
-        else:
-            avg_lbd = 0.0
-            var_lbd = 0.0
-            glue_ratio = 0.0
+        avg_lbd = self.recent_lbd.mean()
+        var_lbd = self.recent_lbd.variance()
+        glue_ratio = self.recent_lbd.glue_ratio()
         conf_rate = (since_conflicts / max(1e-3, since_time))
-        max_act = max(self.activity[1:], default=1.0)
-        mean_act = sum(self.activity[1:]) / max(1, self.num_vars)
-        std_act = math.sqrt(max(0.0, sum((a - mean_act) ** 2 for a in self.activity[1:]) / max(1, self.num_vars)))
+        max_act, mean_act, std_act = self.activity_stats()
         mean_act_n = mean_act / max(1e-9, max_act)
         std_act_n = std_act / max(1e-9, max_act)
-        total_clauses = len(self.clauses)
-        learned = max(0, total_clauses - self.orig_clause_count)
+        learned = self.learnt_count
+        total_clauses = self.orig_clause_count + learned
         learned_ratio = learned / max(1, total_clauses)
         clause_var_ratio = total_clauses / max(1, self.num_vars)
         restarts_rate = (self.restarts) / max(1, self.conflicts)
@@ -87,9 +85,7 @@ class CDCLSolverRL(CDCLCore):
         v = self.pick_first_unassigned()
         if v is None:
             return None
-        if self.phase[v] is not None:
-            return v if self.phase[v] else -v
-        return v
+        return self.phase[v] or v
 
     def _compute_epoch_reward(self, d_conf: int, d_dec: int, d_prop: int, prev_avg_lbd: float, curr_avg_lbd: float, solved: bool) -> float:
         r = 1.0 / (1.0 + d_conf)
@@ -106,7 +102,7 @@ class CDCLSolverRL(CDCLCore):
         d_conf = self.conflicts - self.epoch_start_conflicts
         d_dec = self.decisions - self.epoch_start_decisions
         d_prop = self.propagations - self.epoch_start_props
-        curr_avg_lbd = (sum(self.recent_lbd) / len(self.recent_lbd)) if self.recent_lbd else 0.0
+        curr_avg_lbd = self.recent_lbd.mean()
         prev_avg_lbd = curr_avg_lbd
         reward = self._compute_epoch_reward(d_conf, d_dec, d_prop, prev_avg_lbd, curr_avg_lbd, solved=final)
         self.agent.update(self.last_arm, self.last_context, reward)
@@ -157,25 +153,22 @@ class CDCLSolverRL(CDCLCore):
             conflict = self.propagate()
             if conflict is not None:
                 self.conflicts += 1
-                now = time.time()
-                if self.conflicts % 50 == 0 or now - last_log > 2:
-                    print(f"[RL] lvl={self.decision_level} conf={self.conflicts} dec={self.decisions} prop={self.propagations} rest={self.restarts} heur={self.heuristic_names[self.current_arm]}")
-                    last_log = now
+                if self.conflicts % 50 == 0:
+                    log.info("[RL] lvl=%d conf=%d dec=%d prop=%d rest=%d heur=%s", self.decision_level, self.conflicts,
+                             self.decisions, self.propagations, self.restarts, self.heuristic_names[self.current_arm])
+                    last_log = time.time()
                 if self.decision_level == 0:
-                    print('[RL] UNSAT at level 0')
+                    log.info('[RL] UNSAT at level 0')
                     self._end_epoch_update(final=True)
                     return False
                 learnt, bt = self.analyze_conflict(conflict)
                 self.backtrack(bt)
-                self.clauses.append(learnt)
+                self.add_learnt(learnt)
                 # notify JW
                 for h in self.heuristics:
                     if isinstance(h, JWStrategy):
                         h.notify_clause_added(self, learnt)
-                # watch
-                self.watch_literal(learnt, learnt[0])
-                if len(learnt) > 1:
-                    self.watch_literal(learnt, learnt[1])
+                # after the backjump the learnt clause is unit; it is its asserting literal's reason
                 self.enqueue(learnt[0], learnt)
                 self.maybe_restart()
                 if (self.conflicts - self.epoch_start_conflicts) >= self.epoch_size:
@@ -184,12 +177,15 @@ class CDCLSolverRL(CDCLCore):
             else:
                 lit = self.pick_branch_literal()
                 if lit is None:
-                    print(f"[RL] SAT after {self.conflicts} conflicts")
+                    log.info("[RL] SAT after %d conflicts", self.conflicts)
                     self._end_epoch_update(final=True)
                     return True
                 self.decision_level += 1
                 self.trail_limits.append(len(self.trail))
                 self.enqueue(lit, None)
-                if time.time() - last_log > 2:
-                    print(f"[RL] new lvl={self.decision_level} heur={self.heuristic_names[self.current_arm]}")
-                    last_log = time.time()
+                # the 2s heartbeat only needs the clock every few decisions, not on each one
+                if self.decisions % 50 == 0:
+                    now = time.time()
+                    if now - last_log > 2:
+                        log.info("[RL] new lvl=%d heur=%s", self.decision_level, self.heuristic_names[self.current_arm])
+                        last_log = now
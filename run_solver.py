@@ -1,9 +1,15 @@
 import argparse
+import functools
+import logging
+import re
 import time
 import sys
-from typing import Tuple
+import warnings
+from typing import Tuple, Union
 from pathlib import Path
 
+import numpy as np
+
 # Add project directories to path for imports
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
@@ -14,45 +20,160 @@ sys.path.insert(0, str(project_root / 'heuristics'))
 sys.path.insert(0, str(project_root / 'bandit'))
 sys.path.insert(0, str(project_root / 'utils'))
 
-from cdcl_rl import CDCLSolverRL
-from cdcl_baseline import CDCLSolverBaseline
 from logging_utils import CSVLogger
+from cdcl_core import clauses_from_csr
+
+# per-epoch CSV columns ahead of the context features c0..cN
+BASE_FIELDS = (
+    'epoch', 'heuristic', 'reward', 'd_conflicts', 'd_decisions', 'd_propagations',
+    'avg_lbd', 'conflicts', 'decisions', 'propagations', 'restarts'
+)
+
+_PROBLEM_RE = re.compile(r'^[ \t]*p[ \t]+\S+[ \t]+(\d+)', re.M)
+_META_RE = re.compile(r'^[ \t]*[cp%].*$', re.M)
+# the same patterns for bytes input (the blocks read by parse_dimacs_file)
+_PROBLEM_RE_B = re.compile(_PROBLEM_RE.pattern.encode(), re.M)
+_META_RE_B = re.compile(_META_RE.pattern.encode(), re.M)
+
+
+def _tokenize(dimacs: Union[str, bytes], meta_re, empty) -> np.ndarray:
+    # blank out comment/problem/'%' lines in one pass and tokenize the rest in C
+    body = meta_re.sub(empty, dimacs)
+    if not body or body.isspace():
+        # numpy parses all-whitespace input as [0], which would end a clause carried
+        # over from the previous block
+        return np.empty(0, dtype=np.int64)
+    with warnings.catch_warnings():
+        # depending on the version, numpy raises or only warns (and stops early) on a
+        # malformed token; redo those with int() to get its error message
+        warnings.simplefilter('error', DeprecationWarning)
+        try:
+            return np.fromstring(body, dtype=np.int64, sep=' ')
+        except (DeprecationWarning, ValueError):
+            return np.array(list(map(int, body.split())), dtype=np.int64)
+
+
+def _split_clauses(tokens: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    zeros = np.flatnonzero(tokens == 0)
+    lits = tokens[tokens != 0]
+    # the k-th terminator ends a clause at position zeros[k] - k among the literals;
+    # repeated offsets are empty clauses
+    offsets = np.unique(np.concatenate(([0], zeros - np.arange(len(zeros)), [len(lits)])))
+    return lits, offsets
+
+
+def parse_dimacs_arrays(dimacs: Union[str, bytes]) -> Tuple[int, np.ndarray, np.ndarray]:
+    """Parse DIMACS text into a flat literal array and clause offsets.
+
+    Accepts str or any bytes-like buffer. Clause i is lits[offsets[i]:offsets[i + 1]];
+    empty clauses are skipped.
+    """
+    if isinstance(dimacs, str):
+        problem_re, meta_re, empty = _PROBLEM_RE, _META_RE, ''
+    else:
+        problem_re, meta_re, empty = _PROBLEM_RE_B, _META_RE_B, b''
+    m = problem_re.search(dimacs)
+    num_vars = int(m.group(1)) if m else 0
+    lits, offsets = _split_clauses(_tokenize(dimacs, meta_re, empty))
+    return num_vars, lits, offsets
+
+
+def _read_lines_chunked(path: str, chunk_size: int):
+    # yield the file in blocks of about chunk_size bytes, each cut after its last newline
+    # so no line is split across blocks
+    rest = b''
+    with open(path, 'rb') as f:
+        while True:
+            block = f.read(chunk_size)
+            if not block:
+                break
+            buf = rest + block
+            cut = buf.rfind(b'\n') + 1
+            if cut:
+                yield buf[:cut]
+            rest = buf[cut:]
+    if rest:
+        yield rest
 
 
-def parse_dimacs(dimacs: str) -> Tuple[int, list[list[int]]]:
-    lines = dimacs.splitlines()
-    num_vars = 0
+def parse_dimacs(dimacs: Union[str, bytes]) -> Tuple[int, list[list[int]]]:
+    num_vars, lits, offsets = parse_dimacs_arrays(dimacs)
+    return num_vars, clauses_from_csr(lits, offsets)
+
+
+def _iter_clause_blocks(path: str, chunk_size: int):
+    # (num_vars or None, lits, offsets) per block of the file; the literals after a block's
+    # last terminator are carried into the next one, so no clause is split
+    num_vars = None
+    carry = np.empty(0, dtype=np.int64)
+    for buf in _read_lines_chunked(path, chunk_size):
+        if num_vars is None:
+            m = _PROBLEM_RE_B.search(buf)
+            if m:
+                num_vars = int(m.group(1))
+        tokens = _tokenize(buf, _META_RE_B, b'')
+        if len(carry):
+            tokens = np.concatenate((carry, tokens))
+        zeros = np.flatnonzero(tokens == 0)
+        end = zeros[-1] + 1 if len(zeros) else 0
+        yield (num_vars, *_split_clauses(tokens[:end]))
+        carry = tokens[end:]
+    # an unterminated last clause still counts, as in parse_dimacs
+    yield (num_vars, *_split_clauses(carry))
+
+
+def parse_dimacs_file(path: str, chunk_size: int = 1 << 20) -> Tuple[int, list[list[int]]]:
+    """parse_dimacs for a file, read and tokenized chunk_size bytes at a time.
+
+    Each block's clauses are converted as soon as it is read. Only one block of text
+    and tokens is alive at a time, next to the clause lists being built.
+    """
+    num_vars = None
     clauses = []
-    for line in lines:
-        line = line.strip()
-        if not line or line.startswith('c'):
-            continue
-        if line.startswith('p'):
-            parts = line.split()
-            num_vars = int(parts[2])
-        else:
-            lits = list(map(int, line.split()))
-            if len(lits) > 0 and lits[-1] == 0:
-                lits.pop()
-            if lits:
-                clauses.append(lits)
-    return num_vars, clauses
-
-
-def parse_dimacs_file(path: str) -> Tuple[int, list[list[int]]]:
-    with open(path, 'r') as f:
-        return parse_dimacs(f.read())
+    for num_vars, lits, offsets in _iter_clause_blocks(path, chunk_size):
+        clauses += clauses_from_csr(lits, offsets)
+    return num_vars or 0, clauses
+
+
+def parse_dimacs_csr(path: str, chunk_size: int = 1 << 20) -> Tuple[int, np.ndarray, np.ndarray]:
+    """Parse a CNF file into int32 literals and int64 clause offsets (CSR layout).
+
+    Clause i is lits[offsets[i]:offsets[i + 1]]. The solvers accept the (lits, offsets)
+    pair in place of a clause list.
+    """
+    num_vars = None
+    lit_parts = []
+    offset_parts = [np.zeros(1, dtype=np.int64)]
+    base = 0
+    for num_vars, lits, offsets in _iter_clause_blocks(path, chunk_size):
+        lit_parts.append(lits.astype(np.int32))
+        offset_parts.append(offsets[1:] + base)
+        base += len(lits)
+    return num_vars or 0, np.concatenate(lit_parts), np.concatenate(offset_parts)
+
+
+@functools.lru_cache(maxsize=None)
+def make_fieldnames(ctx_dim: int) -> Tuple[str, ...]:
+    return BASE_FIELDS + tuple(f'c{i}' for i in range(ctx_dim))
+
+
+# built once at import; main() only parses, so drivers calling it repeatedly skip the setup
+_PARSER = argparse.ArgumentParser(description="CDCL SAT Solver (RL and Baseline)")
+_PARSER.add_argument('--mode', choices=['rl', 'baseline'], default='rl', help='Run RL-enabled solver or baseline')
+_PARSER.add_argument('--heuristic', choices=['vsids', 'jw', 'dlis', 'random'], default='vsids', help='Baseline heuristic (ignored in RL mode)')
+_PARSER.add_argument('--cnf', type=str, help='Path to DIMACS CNF file')
+_PARSER.add_argument('--epoch', type=int, default=50, help='Conflicts per epoch (RL or baseline logging)')
+_PARSER.add_argument('--restart', type=int, default=200, help='Conflicts per restart')
+_PARSER.add_argument('--log', type=str, default=None, help='CSV file to log per-epoch metrics')
+_PARSER.add_argument('--quiet', action='store_true', help='Suppress solver progress messages')
 
 
 def main():
-    parser = argparse.ArgumentParser(description="CDCL SAT Solver (RL and Baseline)")
-    parser.add_argument('--mode', choices=['rl', 'baseline'], default='rl', help='Run RL-enabled solver or baseline')
-    parser.add_argument('--heuristic', choices=['vsids', 'jw', 'dlis', 'random'], default='vsids', help='Baseline heuristic (ignored in RL mode)')
-    parser.add_argument('--cnf', type=str, help='Path to DIMACS CNF file')
-    parser.add_argument('--epoch', type=int, default=50, help='Conflicts per epoch (RL or baseline logging)')
-    parser.add_argument('--restart', type=int, default=200, help='Conflicts per restart')
-    parser.add_argument('--log', type=str, default=None, help='CSV file to log per-epoch metrics')
-    args = parser.parse_args()
+    args = _PARSER.parse_args()
+
+    # solver progress goes through the 'cdcl' logger; show it on stdout unless --quiet
+    logging.basicConfig(stream=sys.stdout, format='%(message)s',
+                        level=logging.WARNING if args.quiet else logging.INFO)
 
     example_dimacs = '''
 c Example
@@ -66,30 +187,31 @@ p cnf 3 2
     else:
         n, cls = parse_dimacs(example_dimacs)
 
+    # solver modules are imported for the chosen mode only, so importing this module for
+    # its parsers (as testing_benchmark does) does not load both solvers
     if args.mode == 'rl':
+        from cdcl_rl import CDCLSolverRL
         solver = CDCLSolverRL(n, cls)
         solver.epoch_size = args.epoch
         solver.restart_interval = args.restart
     else:
+        from cdcl_baseline import CDCLSolverBaseline
         solver = CDCLSolverBaseline(n, cls, heuristic=args.heuristic)
         solver.restart_interval = args.restart
         solver.epoch_size = args.epoch
 
-    # optional logging: build fieldnames based on context length
+    # optional logging: fieldnames come from the solver's (fixed) context length
     if args.log:
-        # probe context dimension
-        if args.mode == 'rl':
-            ctx = solver.feature_context(0, 0, 0, 1e-3)
-        else:
-            ctx = solver.feature_context(0, 0, 0, 0.0)
-        fieldnames = [
-            'epoch', 'heuristic', 'reward', 'd_conflicts', 'd_decisions', 'd_propagations',
-            'avg_lbd', 'conflicts', 'decisions', 'propagations', 'restarts'
-        ] + [f'c{i}' for i in range(len(ctx))]
+        fieldnames = list(make_fieldnames(type(solver).CONTEXT_DIM))
         solver.logger = CSVLogger(args.log, fieldnames)
 
     t0 = time.time()
-    sat = solver.solve()
+    try:
+        sat = solver.solve()
+    finally:
+        # the logger buffers rows in an open file; close it even if the solve is interrupted
+        if solver.logger is not None:
+            solver.logger.close()
     dt = time.time() - t0
     print(f"Result: {'SAT' if sat else 'UNSAT'}, time={dt:.4f}s, conflicts={solver.conflicts}, decisions={solver.decisions}, propagations={solver.propagations}")
 
@@ -1,16 +1,23 @@
 #!/usr/bin/env python3
 """
 Simple testing benchmark - runs RL vs Baseline on all test CNFs with 1 min timeout.
-Prints results to terminal and logs to timestamped file.
+Runs are spread over a pool of worker processes; results are printed in instance order.
+Prints results to terminal and logs to timestamped file, with a JSONL copy (one
+record per instance) next to it for downstream analysis.
+Each finished instance is also appended to a progress file, so an interrupted run
+picks up where it stopped instead of solving everything again.
+With --quick, Baseline is skipped on instances where RL timed out.
 """
 import sys
+import json
+import argparse
 import time
 import signal
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from contextlib import contextmanager
-import io
+from contextlib import contextmanager, redirect_stdout, redirect_stderr
 
 # Add project directories to path
 project_root = Path(__file__).parent
@@ -23,8 +30,6 @@ sys.path.insert(0, str(project_root / 'bandit'))
 sys.path.insert(0, str(project_root / 'utils'))
 
 from run_solver import parse_dimacs_file
-from cdcl_rl import CDCLSolverRL
-from cdcl_baseline import CDCLSolverBaseline
 
 
 class TimeoutException(Exception):
@@ -33,30 +38,45 @@ class TimeoutException(Exception):
 
 @contextmanager
 def suppress_output():
-    """Context manager to suppress stdout and stderr"""
-    save_stdout = sys.stdout
-    save_stderr = sys.stderr
-    sys.stdout = io.StringIO()
-    sys.stderr = io.StringIO()
-    try:
-        yield
-    finally:
-        sys.stdout = save_stdout
-        sys.stderr = save_stderr
+    """Context manager to suppress stdout and stderr
+
+    Writes go to os.devnull instead of a growing buffer; fds 1 and 2 are pointed
+    there too, so output from C code is dropped as well.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved_fds = (os.dup(1), os.dup(2))
+    with open(os.devnull, 'w') as devnull:
+        os.dup2(devnull.fileno(), 1)
+        os.dup2(devnull.fileno(), 2)
+        try:
+            with redirect_stdout(devnull), redirect_stderr(devnull):
+                yield
+        finally:
+            os.dup2(saved_fds[0], 1)
+            os.dup2(saved_fds[1], 2)
+            os.close(saved_fds[0])
+            os.close(saved_fds[1])
 
 
 def timeout_handler(signum, frame):
     raise TimeoutException()
 
 
-def run_solver(cnf_path, mode, timeout_sec=60):
-    """Run a solver with timeout. Returns (status, time, conflicts)"""
+def run_solver_parsed(num_vars, clauses, mode, timeout_sec=60):
+    """Run a solver with timeout on an already parsed CNF. Returns (status, time, conflicts)
+
+    Runs inside a pool worker; the alarm is per process, so concurrent runs each
+    get their own timeout. The solver appends learnt clauses to clauses, so each
+    run needs its own list.
+    The solver module is imported here, so a worker only loads the modes it runs.
+    """
     try:
-        num_vars, clauses = parse_dimacs_file(cnf_path)
-        
         if mode == 'rl':
+            from cdcl_rl import CDCLSolverRL
             solver = CDCLSolverRL(num_vars, clauses)
         else:
+            from cdcl_baseline import CDCLSolverBaseline
             solver = CDCLSolverBaseline(num_vars, clauses, heuristic='vsids')
         
         # Set timeout
@@ -83,7 +103,69 @@ def run_solver(cnf_path, mode, timeout_sec=60):
         signal.alarm(0)
 
 
+def run_instance(cnf_path, timeout_sec=60, quick=False):
+    """Parse cnf_path once and run RL, then Baseline on it. Returns (rl_result, bl_result)
+
+    main() submits paths rather than parsed clauses: the parent would otherwise keep
+    every pending instance's clause lists alive (in the pool's work items) at once.
+    Both runs happen in one worker, so with quick the Baseline run can be dropped
+    without a round trip to the parent when RL timed out; SKIPPED stands in for its
+    result then.
+    """
+    try:
+        num_vars, clauses = parse_dimacs_file(cnf_path)
+    except Exception:
+        return ('ERROR', 0, 0), ('ERROR', 0, 0)
+    # the solver appends its learnt clauses to the list it is given but never modifies the
+    # input clauses, so RL gets a copy of the list and Baseline reuses the clauses as parsed
+    rl = run_solver_parsed(num_vars, list(clauses), 'rl', timeout_sec)
+    if quick and rl[0] == 'TIMEOUT':
+        return rl, ('SKIPPED', timeout_sec, 0)
+    return rl, run_solver_parsed(num_vars, clauses, 'baseline', timeout_sec)
+
+
+def write_rows(out):
+    """Write and flush the buffered table rows in one call. Returns the flush time"""
+    sys.stdout.write(''.join(out))
+    sys.stdout.flush()
+    out.clear()
+    return time.monotonic()
+
+
+def load_progress(progress_file, timeout, quick=False):
+    """Read the results an interrupted run left behind. Returns {instance: result}
+
+    Records from a run with a different timeout are not comparable and are ignored, and
+    so are skipped Baseline runs unless this run is --quick too.
+    A half-written last line (the run died mid-write) is cut off the file, so the records
+    this run appends start on a line of their own.
+    """
+    done = {}
+    if not progress_file.exists():
+        return done
+    with open(progress_file, 'rb+') as f:
+        end = 0
+        for line in f:
+            if not line.endswith(b'\n'):
+                f.truncate(end)
+                break
+            end += len(line)
+            try:
+                r = json.loads(line)
+            except ValueError:
+                continue
+            if r.get('timeout') == timeout and (quick or r.get('bl_status') != 'SKIPPED'):
+                done[r['instance']] = r
+    return done
+
+
+_PARSER = argparse.ArgumentParser(description="RL vs Baseline on all test CNFs")
+_PARSER.add_argument('--quick', action='store_true',
+                     help='Skip the Baseline run on instances where RL timed out')
+
+
 def main():
+    args = _PARSER.parse_args()
     timeout = 60  # 1 minute
     test_dir = Path(__file__).parent / 'test_cnfs'
     log_dir = Path(__file__).parent / 'bechmark_results_logs'
@@ -91,8 +173,10 @@ def main():
     # Create log directory if it doesn't exist
     log_dir.mkdir(exist_ok=True)
     
-    # Get all CNF files
-    cnf_files = sorted(test_dir.glob('*.cnf'))
+    # Get all CNF files as (name, path) strings; scandir reads names and types in one
+    # pass instead of a stat and a Path object per entry
+    with os.scandir(test_dir) as it:
+        cnf_files = sorted((e.name, e.path) for e in it if e.name.endswith('.cnf') and e.is_file())
     
     if not cnf_files:
         print("No CNF files found!")
@@ -101,23 +185,50 @@ def main():
     # Create timestamped log file
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     log_file = log_dir / f'test_results_{timestamp}.log'
+    jsonl_file = log_dir / f'test_results_{timestamp}.jsonl'
+    progress_file = log_dir / 'in_progress.jsonl'
+    done = load_progress(progress_file, timeout, args.quick)
     
     print(f"\n{'='*70}")
     print(f"Testing {len(cnf_files)} instances with {timeout}s timeout")
+    if done:
+        print(f"Resuming: {len(done)} instances already in {progress_file.name}")
     print(f"{'='*70}\n")
     
     rl_wins = 0
     bl_wins = 0
+    skipped = 0
     results = []
     
-    for i, cnf_path in enumerate(cnf_files, 1):
-        print(f"[{i}/{len(cnf_files)}] {cnf_path.name:<20} ", end='', flush=True)
-        
-        # Run RL
-        rl_status, rl_time, rl_conf = run_solver(cnf_path, 'rl', timeout)
-        
-        # Run Baseline
-        bl_status, bl_time, bl_conf = run_solver(cnf_path, 'baseline', timeout)
+    # one job per instance; half the cores so concurrent runs don't skew the timings
+    workers = max(1, (os.cpu_count() or 2) // 2)
+    pool = ProcessPoolExecutor(max_workers=workers)
+    futures = {}
+    for name, cnf_path in cnf_files:
+        if name in done:
+            continue
+        # workers parse the file themselves, so the parent holds no clauses
+        futures[name] = pool.submit(run_instance, cnf_path, timeout, args.quick)
+    
+    # line buffered, and fsynced per record, so a crash loses at most the instance in flight
+    progress = open(progress_file, 'a', buffering=1)
+    # table rows are collected and written at most once a second, or before waiting on a
+    # run that is still going, instead of a flushed print per instance
+    out = []
+    last_flush = time.monotonic()
+    width = len(str(len(cnf_files)))
+    for i, (name, cnf_path) in enumerate(cnf_files, 1):
+        if name in done:
+            r = done[name]
+            rl_status, rl_time, rl_conf = r['rl_status'], r['rl_time'], r.get('rl_conflicts', 0)
+            bl_status, bl_time, bl_conf = r['bl_status'], r['bl_time'], r.get('bl_conflicts', 0)
+        else:
+            if out and not futures[name].done():
+                last_flush = write_rows(out)
+            # RL and Baseline results (already queued on the pool)
+            (rl_status, rl_time, rl_conf), (bl_status, bl_time, bl_conf) = futures[name].result()
+        if bl_status == 'SKIPPED':
+            skipped += 1
         
         # Determine winner
         if rl_status in ['SAT', 'UNSAT'] and bl_status in ['SAT', 'UNSAT']:
@@ -133,20 +244,37 @@ def main():
         elif bl_status in ['SAT', 'UNSAT']:
             winner = 'BL (only solved)'
             bl_wins += 1
+        elif bl_status == 'SKIPPED':
+            winner = 'NONE (RL timed out)'
         else:
             winner = 'NONE (both failed)'
         
-        # Print result
-        print(f"RL: {rl_status:8} ({rl_time:6.2f}s) | BL: {bl_status:8} ({bl_time:6.2f}s) | → {winner}")
+        # Print result (counter padded so the columns line up past 9 instances)
+        out.append(f"[{i:>{width}}/{len(cnf_files)}] {name:<20} "
+                   f"RL: {rl_status:8} ({rl_time:6.2f}s) | BL: {bl_status:8} ({bl_time:6.2f}s) | → {winner}\n")
+        if time.monotonic() - last_flush >= 1.0:
+            last_flush = write_rows(out)
         
+        # when the instance finished; resumed records keep their original time
+        finished = done[name].get('timestamp') if name in done else datetime.now().isoformat(timespec='seconds')
         results.append({
-            'instance': cnf_path.name,
+            'instance': name,
             'rl_status': rl_status,
             'rl_time': rl_time,
+            'rl_conflicts': rl_conf,
             'bl_status': bl_status,
             'bl_time': bl_time,
-            'winner': winner
+            'bl_conflicts': bl_conf,
+            'winner': winner,
+            'timestamp': finished
         })
+        if name not in done:
+            progress.write(json.dumps(dict(results[-1], timeout=timeout)) + '\n')
+            os.fsync(progress.fileno())
+        
+    write_rows(out)
+    progress.close()
+    pool.shutdown()
     
     # Print summary
     print(f"\n{'='*70}")
@@ -154,6 +282,8 @@ def main():
     print(f"{'='*70}")
     print(f"RL Wins:       {rl_wins}/{len(cnf_files)}")
     print(f"Baseline Wins: {bl_wins}/{len(cnf_files)}")
+    if skipped:
+        print(f"BL Skipped:    {skipped}/{len(cnf_files)}")
     print(f"{'='*70}\n")
     
     # Write log file
@@ -162,14 +292,26 @@ def main():
         f.write(f"Timeout: {timeout}s\n")
         f.write(f"Instances tested: {len(cnf_files)}\n\n")
         f.write(f"RL Wins: {rl_wins}/{len(cnf_files)}\n")
-        f.write(f"Baseline Wins: {bl_wins}/{len(cnf_files)}\n\n")
+        f.write(f"Baseline Wins: {bl_wins}/{len(cnf_files)}\n")
+        if skipped:
+            f.write(f"Baseline Skipped: {skipped}/{len(cnf_files)}\n")
+        f.write("\n")
         f.write(f"Winner: {'RL' if rl_wins > bl_wins else 'BASELINE' if bl_wins > rl_wins else 'TIE'}\n\n")
         f.write("Detailed Results:\n")
         f.write("-" * 70 + "\n")
         for r in results:
             f.write(f"{r['instance']:<20} | RL: {r['rl_status']:8} ({r['rl_time']:6.2f}s) | BL: {r['bl_status']:8} ({r['bl_time']:6.2f}s)\n")
     
-    print(f"Log saved to: {log_file}")
+    # the same records, one JSON object per line, so runs can be loaded with
+    # pandas.read_json(..., lines=True) instead of parsing the text log
+    with open(jsonl_file, 'w') as f:
+        for r in results:
+            f.write(json.dumps(r) + '\n')
+    
+    # the run is complete, so the next one starts from scratch
+    progress_file.unlink()
+    
+    print(f"Log saved to: {log_file} (records: {jsonl_file.name})")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,142 @@
+import itertools
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / 'rl-cdcl'))
+sys.path.insert(0, str(project_root / 'baseline-cdcl'))
+sys.path.insert(0, str(project_root / 'core_files'))
+sys.path.insert(0, str(project_root / 'heuristics'))
+sys.path.insert(0, str(project_root / 'bandit'))
+sys.path.insert(0, str(project_root / 'utils'))
+
+from cdcl_baseline import CDCLSolverBaseline
+from cdcl_core import CDCLCore
+from cdcl_rl import CDCLSolverRL
+
+MODES = ['vsids', 'jw', 'dlis', 'random', 'rl']
+
+# SAT with a single model; unsound learnt clauses used to make dlis, random and rl answer UNSAT
+ONE_MODEL = [[4, 4, -4], [-4, 3, 2], [-3, 6, 9, 8], [7, -9, 9], [-7, -5, 9, -6], [-6, 2, 1], [4, 2, -8],
+             [7, 5, -1], [6, -4, 4], [-7, 1, 8, 2], [-7, 8, -1], [1, 2], [5, 2, -4], [-4, 6, 6], [6, 6],
+             [-2, -2], [9, 7], [8, 6, 7], [-9, 7], [-4, -9, 6]]
+
+
+def models(num_vars, clauses):
+    return [bits for bits in itertools.product((False, True), repeat=num_vars)
+            if all(any(bits[abs(l) - 1] is (l > 0) for l in c) for c in clauses)]
+
+
+def random_cnf(rng):
+    n = rng.randint(3, 9)
+    clauses = [[rng.choice((-1, 1)) * rng.randint(1, n) for _ in range(rng.randint(1, 4))]
+               for _ in range(rng.randint(3, 25))]
+    return n, clauses
+
+
+def random_3sat(rng):
+    # near the 3-SAT threshold, deep enough in decisions for minimization to find redundant literals
+    n = rng.randint(10, 12)
+    return n, [[v * rng.choice((-1, 1)) for v in rng.sample(range(1, n + 1), 3)] for _ in range(4 * n)]
+
+
+def is_reason_for(solver, var, clause):
+    """True when clause implies var's current value: its literal on var is true, all others false."""
+    return all(solver.assignments[abs(l)] is ((l > 0) if abs(l) == var else (l < 0)) for l in clause)
+
+
+def make_solver(mode, num_vars, clauses, restart_interval):
+    """A solver for mode that records every clause analyze_conflict learns in .learnt,
+    and in .removed how many literals minimize_learnt dropped from them."""
+    base = CDCLSolverRL if mode == 'rl' else CDCLSolverBaseline
+
+    class Recording(base):
+        def analyze_conflict(self, conflict_clause):
+            learnt, bt = super().analyze_conflict(conflict_clause)
+            self.learnt.append(list(learnt))
+            return learnt, bt
+
+        def minimize_learnt(self, clause, current_level):
+            kept, bt = super().minimize_learnt(clause, current_level)
+            assert set(kept) <= set(clause)
+            self.removed += len(clause) - len(kept)
+            return kept, bt
+
+        def add_learnt(self, clause):
+            # solve() enqueues clause[0] right after this: after the backjump it must be the
+            # only literal left unassigned, with all the others false
+            assert self.assignments[abs(clause[0])] is None, clause
+            assert all(self.assignments[abs(l)] is (l < 0) for l in clause[1:]), clause
+            super().add_learnt(clause)
+
+        def lit_redundant(self, var, stamp):
+            # the walk may reach any propagated var on the trail; each reason must be unit
+            for lit in self.trail:
+                r = self.reason[abs(lit)]
+                assert r is None or is_reason_for(self, abs(lit), r), (lit, r)
+            return super().lit_redundant(var, stamp)
+
+    clauses = [list(c) for c in clauses]
+    solver = Recording(num_vars, clauses) if mode == 'rl' else Recording(num_vars, clauses, heuristic=mode)
+    solver.learnt = []
+    solver.removed = 0
+    solver.restart_interval = restart_interval
+    return solver
+
+
+def check(mode, num_vars, clauses, restart_interval):
+    sols = models(num_vars, clauses)
+    solver = make_solver(mode, num_vars, clauses, restart_interval)
+    sat = solver.solve()
+    assert sat == bool(sols)
+    if sat:
+        assert tuple(solver.assignments[v] is True for v in range(1, num_vars + 1)) in sols
+    # every learnt clause must be implied by the formula: true in each of its models
+    for learnt in solver.learnt:
+        assert all(any(bits[abs(l) - 1] is (l > 0) for l in learnt) for bits in sols), learnt
+    return solver
+
+
+@pytest.mark.parametrize('mode', MODES)
+def test_one_model_instance(mode):
+    random.seed(0)
+    check(mode, 9, ONE_MODEL, 7)
+
+
+@pytest.mark.parametrize('mode', MODES)
+def test_learnt_clauses_are_implied(mode):
+    rng = random.Random(1)
+    for i in range(300):
+        num_vars, clauses = random_cnf(rng)
+        random.seed(i)
+        check(mode, num_vars, clauses, rng.choice((7, 200)))
+
+
+@pytest.mark.parametrize('mode', MODES)
+def test_minimized_clauses_are_implied(mode):
+    # minimize_learnt asserts that each reason it walks is unit under the trail, and
+    # check() that the minimized clauses still hold in every model
+    rng = random.Random(2)
+    removed = 0
+    for i in range(30):
+        num_vars, clauses = random_3sat(rng)
+        random.seed(i)
+        removed += check(mode, num_vars, clauses, rng.choice((7, 200))).removed
+    # the instances have to exercise minimization for the check to mean anything
+    assert removed > 0
+
+
+def test_last_unassigned_literal_is_implied():
+    # deciding -1 then -2 leaves 3 as the only literal of [1, 2, 3] that can still be true
+    core = CDCLCore(3, [[1, 2, 3]])
+    core.add_watches()
+    for lit in (-1, -2):
+        core.decision_level += 1
+        core.trail_limits.append(len(core.trail))
+        core.enqueue(lit, None)
+        assert core.propagate() is None
+    assert core.assignments[3] is True
+    assert sorted(core.reason[3]) == [1, 2, 3]
@@ -0,0 +1,29 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from run_solver import clauses_from_csr, parse_dimacs, parse_dimacs_csr, parse_dimacs_file
+
+# blank, whitespace-only and comment lines inside a clause, clauses spanning lines and
+# several clauses on one line
+CASES = [
+    'p cnf 3 1\n1 2\n\n3 0\n',
+    'p cnf 3 1\n1 2\nc note\n3 0\n',
+    'c head\np cnf 4 3\n1 -2\n   \nc mid\n\t\n3 0 -1 4 0\n\n2\nc x\n-3 -4 0\n',
+    'p cnf 5 2\n1\n\n2\n\n3 0\nc tail\n\n4 -5\n',
+]
+
+
+@pytest.mark.parametrize('text', CASES)
+def test_file_parsers_match_parse_dimacs(tmp_path, text):
+    path = tmp_path / 'f.cnf'
+    path.write_text(text)
+    expected = parse_dimacs(text)
+    for chunk_size in range(1, len(text) + 2):
+        assert parse_dimacs_file(str(path), chunk_size) == expected, chunk_size
+        num_vars, lits, offsets = parse_dimacs_csr(str(path), chunk_size)
+        assert (num_vars, clauses_from_csr(lits, offsets)) == expected, chunk_size
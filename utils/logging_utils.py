@@ -16,13 +16,25 @@ class CSVLogger:
             os.makedirs(d, exist_ok=True)
 
     def _init_file(self):
-        write_header = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
-        with open(self.path, 'a', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=self.fieldnames)
-            if write_header:
-                writer.writeheader()
+        # one handle and writer for the logger's lifetime; rows are flushed on close()
+        self._f = open(self.path, 'a', newline='')
+        self._writer = csv.DictWriter(self._f, fieldnames=self.fieldnames)
+        # an append handle starts at the end, so position 0 means a new or empty file
+        if self._f.tell() == 0:
+            self._writer.writeheader()
 
     def log(self, row: Dict[str, Any]):
-        with open(self.path, 'a', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=self.fieldnames)
-            writer.writerow(row)
+        self._writer.writerow(row)
+
+    def flush(self):
+        self._f.flush()
+
+    def close(self):
+        if not self._f.closed:
+            self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()